@@ -2,6 +2,7 @@
 
 import json
 import threading
+from functools import partial
 from tkinter import END, Event, messagebox, scrolledtext
 from tkinter.ttk import Button, Entry, Frame, Label, Widget
 from typing import Final
@@ -288,7 +289,7 @@ class PokedexView(BaseView):
         # Use the stored pokemon name for display.
         if self.frame and self._current_pokemon_name:
             pokemon_name = self._current_pokemon_name
-            self.frame.after(0, lambda: self._display_pokemon_base_image(image=image, pokemon_name=pokemon_name))
+            self.frame.after(0, partial(self._display_pokemon_base_image, image=image, pokemon_name=pokemon_name))
 
     def _on_base_image_error(self, error_message: str) -> None:
         """Handle base image loading error from the service.
@@ -298,7 +299,7 @@ class PokedexView(BaseView):
         """
         # This callback is called from a background thread, so we need to use frame.after.
         if self.frame:
-            self.frame.after(0, lambda: self._show_base_image_error(error_message))
+            self.frame.after(0, partial(self._show_base_image_error, error_message))
 
     def _on_shiny_image_success(self, image: ProcessedImage) -> None:
         """Handle successful shiny image loading from the service.
@@ -310,7 +311,7 @@ class PokedexView(BaseView):
         # Use the stored pokemon name for display.
         if self.frame and self._current_pokemon_name:
             pokemon_name = self._current_pokemon_name
-            self.frame.after(0, lambda: self._display_pokemon_shiny_image(image=image, pokemon_name=pokemon_name))
+            self.frame.after(0, partial(self._display_pokemon_shiny_image, image=image, pokemon_name=pokemon_name))
 
     def _on_shiny_image_error(self, error_message: str) -> None:
         """Handle shiny image loading error from the service.
@@ -320,7 +321,7 @@ class PokedexView(BaseView):
         """
         # This callback is called from a background thread, so we need to use frame.after.
         if self.frame:
-            self.frame.after(0, lambda: self._show_shiny_image_error(error_message))
+            self.frame.after(0, partial(self._show_shiny_image_error, error_message))
 
     def _search_pokemon_thread(self, pokemon_name: str) -> None:
         """Search for Pokémon GO data using the fetch Pokemon use case.
@@ -15,19 +15,29 @@ class HttpxClientAdapter(HttpClientPort):
     Supports both synchronous and asynchronous operations.
     """
 
-    def __init__(self, *, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        *,
+        timeout: float = 30.0,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         """Initialize the httpx client adapter.
 
         Args:
             timeout: Default timeout in seconds for requests.
+            transport: Optional transport for the sync client (e.g. httpx.MockTransport in tests).
+            async_transport: Optional transport for the async client (e.g. httpx.MockTransport in tests).
         """
         self._timeout = timeout
+        self._transport = transport
+        self._async_transport = async_transport
         self._async_client: httpx.AsyncClient | None = None
         self._sync_client: httpx.Client | None = None
 
     def __enter__(self) -> Self:
         """Sync context manager entry."""
-        self._sync_client = httpx.Client(timeout=self._timeout)
+        self._sync_client = httpx.Client(timeout=self._timeout, transport=self._transport)
         return self
 
     def __exit__(
@@ -40,7 +50,7 @@ class HttpxClientAdapter(HttpClientPort):
 
     async def __aenter__(self) -> Self:
         """Async context manager entry."""
-        self._async_client = httpx.AsyncClient(timeout=self._timeout)
+        self._async_client = httpx.AsyncClient(timeout=self._timeout, transport=self._async_transport)
         return self
 
     async def __aexit__(
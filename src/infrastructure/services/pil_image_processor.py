@@ -5,8 +5,6 @@ from collections.abc import Callable
 from io import BytesIO
 from typing import Final
 
-from PIL import Image, ImageTk
-
 from src.domain.interfaces.image_processor import ImageProcessor, ProcessedImage
 
 
@@ -15,6 +13,14 @@ class PILImageProcessor(ImageProcessor):
 
     _RGBA_MODE: Final[str] = "RGBA"
 
+    def __init__(self, *, thread_factory: Callable[..., threading.Thread] = threading.Thread) -> None:
+        """Initialize the PIL image processor.
+
+        Args:
+            thread_factory: Callable that creates the background thread for async fetches (e.g. a Mock in tests).
+        """
+        self._thread_factory = thread_factory
+
     def fetch_image_sync(self, *, image_data: bytes) -> ProcessedImage:
         """Fetch and process an image synchronously.
 
@@ -49,7 +55,7 @@ class PILImageProcessor(ImageProcessor):
         Returns:
             The thread handling the image fetch operation.
         """
-        thread = threading.Thread(
+        thread = self._thread_factory(
             target=self._fetch_image_thread,
             args=(image_data, on_success, on_error, on_started, on_finished, cancellation_check),
             daemon=True,
@@ -98,6 +104,9 @@ class PILImageProcessor(ImageProcessor):
         Returns:
             Processed image ready for display, or None if cancelled/failed.
         """
+        # Imported on first use so loading this module (e.g. for DI wiring) does not pull in PIL and Tk.
+        from PIL import Image, ImageTk
+
         try:
             pil_image = Image.open(fp=BytesIO(initial_bytes=image_data))
             converted_image = pil_image.convert(self._RGBA_MODE) if pil_image.mode != self._RGBA_MODE else pil_image
@@ -1,6 +1,5 @@
-import tkinter as tk
 import unittest
-from unittest.mock import MagicMock, Mock, call, patch
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
 
 from src.application.app import PokemonGoApp
 
@@ -9,31 +8,29 @@ class TestPokemonGoApp(unittest.TestCase):
     """Test cases for PokemonGoApp class."""
 
     @patch("src.application.app.injector")
-    @patch("tkinter.Label")
-    @patch("tkinter.Frame")
-    @patch("tkinter.Tk")
-    def setUp(self, mock_tk_class: Mock, mock_frame_class: Mock, mock_label_class: Mock, mock_injector: Mock) -> None:
+    def setUp(self, mock_injector: Mock) -> None:
         """Set up test fixtures."""
-        # Mock the root window
-        self.mock_root = MagicMock()
-        self.mock_root.winfo_screenwidth.return_value = 1920
-        self.mock_root.winfo_screenheight.return_value = 1080
-        mock_tk_class.return_value = self.mock_root
-
-        # Mock Frame class
-        self.mock_frame = MagicMock()
-        mock_frame_class.return_value = self.mock_frame
-
-        # Mock Label class
-        self.mock_label = MagicMock()
-        mock_label_class.return_value = self.mock_label
-
-        # Mock the injector
-        mock_http_client = Mock()
-        mock_injector.get.return_value = mock_http_client
-
-        # Create the app
-        self.app = PokemonGoApp()
+        with patch.multiple("tkinter", Tk=DEFAULT, Frame=DEFAULT, Label=DEFAULT) as mock_tkinter:
+            # Mock the root window
+            self.mock_root = MagicMock()
+            self.mock_root.winfo_screenwidth.return_value = 1920
+            self.mock_root.winfo_screenheight.return_value = 1080
+            mock_tkinter["Tk"].return_value = self.mock_root
+
+            # Mock Frame class
+            self.mock_frame = MagicMock()
+            mock_tkinter["Frame"].return_value = self.mock_frame
+
+            # Mock Label class
+            self.mock_label = MagicMock()
+            mock_tkinter["Label"].return_value = self.mock_label
+
+            # Mock the injector
+            mock_http_client = Mock()
+            mock_injector.get.return_value = mock_http_client
+
+            # Create the app
+            self.app = PokemonGoApp()
         self.app.status_label = self.mock_label
 
     def test_initialization(self) -> None:
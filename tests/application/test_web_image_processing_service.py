@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 from src.application.services.web_image_processing import WebImageProcessingService
 from src.domain.interfaces.image_processor import ImageProcessor
@@ -12,9 +12,8 @@ class TestWebImageProcessingService(unittest.TestCase):
     def setUp(self) -> None:
         """Set up test fixtures."""
         self.mock_image_processor = Mock(spec=ImageProcessor)
-        self.mock_http_client = Mock(spec=HttpClientPort)
-        self.mock_http_client.__enter__ = Mock(return_value=self.mock_http_client)
-        self.mock_http_client.__exit__ = Mock(return_value=None)
+        self.mock_http_client = MagicMock(spec=HttpClientPort)
+        self.mock_http_client.__enter__.return_value = self.mock_http_client
         self.service = WebImageProcessingService(
             image_processor=self.mock_image_processor, http_client=self.mock_http_client
         )
@@ -0,0 +1,53 @@
+from typing import Iterator
+from unittest.mock import Mock, create_autospec
+
+import pytest
+
+from src.application.services.web_image_processing import WebImageProcessingService
+from src.application.use_cases.fetch_pokemon_use_case import FetchPokemonUseCase
+from src.application.views.pokedex_view import PokedexView
+
+
+@pytest.fixture
+def mock_navigator() -> Mock:
+    """Fixture providing a mocked view navigator."""
+    return Mock()
+
+
+@pytest.fixture(scope="module")
+def mock_image_service() -> Mock:
+    """Fixture providing a module-wide mocked WebImageProcessingService with an autospec."""
+    return create_autospec(WebImageProcessingService, instance=True)
+
+
+@pytest.fixture(scope="module")
+def mock_fetch_pokemon_use_case() -> Mock:
+    """Fixture providing a module-wide mocked FetchPokemonUseCase with an autospec."""
+    return create_autospec(FetchPokemonUseCase, instance=True)
+
+
+@pytest.fixture(autouse=True)
+def _reset_service_mocks(mock_image_service: Mock, mock_fetch_pokemon_use_case: Mock) -> Iterator[None]:
+    """Fixture resetting the module-wide service mocks so no state bleeds between tests."""
+    yield
+    mock_image_service.reset_mock(return_value=True, side_effect=True)
+    mock_fetch_pokemon_use_case.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def pokedex_view(mock_navigator: Mock, mock_image_service: Mock, mock_fetch_pokemon_use_case: Mock) -> PokedexView:
+    """Fixture providing a PokedexView wired to mocked collaborators."""
+    return PokedexView(
+        parent=Mock(),
+        navigator=mock_navigator,
+        image_service=mock_image_service,
+        fetch_pokemon_use_case=mock_fetch_pokemon_use_case,
+    )
+
+
+@pytest.fixture
+def bare_view(mock_navigator: Mock) -> PokedexView:
+    """Fixture providing an uninitialized PokedexView with only a navigator, for tests that set their own state."""
+    view = PokedexView.__new__(PokedexView)
+    view.navigator = mock_navigator
+    return view
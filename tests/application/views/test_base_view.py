@@ -1,4 +1,6 @@
+import os
 import platform
+import sys
 import tkinter as tk
 import unittest
 from tkinter.ttk import Widget
@@ -8,9 +10,14 @@ import pytest
 
 from src.application.views.base_view import BaseView, ViewNavigator
 
-pytestmark = pytest.mark.skipif(
-    platform.system() == "Windows", reason="Tkinter tests are unreliable on Windows due to Tcl/Tk issues."
-)
+_TK_AVAILABLE = bool(os.environ.get("DISPLAY")) or sys.platform == "darwin"
+
+pytestmark = [
+    pytest.mark.skipif(
+        platform.system() == "Windows", reason="Tkinter tests are unreliable on Windows due to Tcl/Tk issues."
+    ),
+    pytest.mark.skipif(not _TK_AVAILABLE, reason="No display available for Tk."),
+]
 
 
 class MockTestView(BaseView):
@@ -32,9 +39,20 @@ class MockTestView(BaseView):
 class TestBaseView(unittest.TestCase):
     """Test cases for BaseView class."""
 
+    root: tk.Tk
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Start a single Tk interpreter shared by every test in the class."""
+        cls.root = tk.Tk()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Shut down the shared Tk interpreter."""
+        cls.root.destroy()
+
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.root = tk.Tk()
         from tkinter.ttk import Frame
 
         self.parent_frame = Frame(self.root)
@@ -44,7 +62,7 @@ class TestBaseView(unittest.TestCase):
     def tearDown(self) -> None:
         """Clean up test fixtures."""
         self.view.destroy()
-        self.root.destroy()
+        self.parent_frame.destroy()
 
     def test_initialization(self) -> None:
         """Test view initialization."""
@@ -1,236 +1,225 @@
-import unittest
-from typing import Any, Callable
-from unittest.mock import Mock, patch
+from functools import partial
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Iterator, Mapping
+from unittest.mock import MagicMock, Mock, call, patch, sentinel
+
+import pytest
 
-from src.application.services.web_image_processing import WebImageProcessingService
-from src.application.use_cases.fetch_pokemon_use_case import FetchPokemonUseCase
 from src.application.views.pokedex_view import PokedexView
-from src.domain.interfaces.image_processor import ProcessedImage
 from src.infrastructure.constants.api_constants import (
     POKEMON_ASSETS_KEY,
     POKEMON_IMAGE_KEY,
     POKEMON_SHINY_IMAGE_KEY,
 )
 
+_DATA_BOTH = MappingProxyType(
+    {
+        "id": 25,
+        POKEMON_ASSETS_KEY: MappingProxyType(
+            {
+                POKEMON_IMAGE_KEY: "https://example.com/pikachu.png",
+                POKEMON_SHINY_IMAGE_KEY: "https://example.com/pikachu_shiny.png",
+            }
+        ),
+    }
+)
+_DATA_BASE_ONLY = MappingProxyType(
+    {"id": 25, POKEMON_ASSETS_KEY: MappingProxyType({POKEMON_IMAGE_KEY: "https://example.com/pikachu.png"})}
+)
+_DATA_NO_IMAGES = MappingProxyType({"name": "Pikachu"})
+_DATA_MISSING_ID = MappingProxyType(
+    {POKEMON_ASSETS_KEY: MappingProxyType({POKEMON_IMAGE_KEY: "https://example.com/image.png"})}
+)
+_DATA_EMPTY: MappingProxyType[str, Any] = MappingProxyType({})
 
-class TestPokedexView(unittest.TestCase):
-    """Test cases for PokedexView."""
-
-    def create_mock_image_service(self) -> Mock:
-        return Mock(spec=WebImageProcessingService)
-
-    def create_mock_fetch_pokemon_use_case(self) -> Mock:
-        return Mock(spec=FetchPokemonUseCase)
-
-    def setUp(self) -> None:
-        self.mock_parent = Mock()
-        self.mock_navigator = Mock()
-        self.mock_image_service = self.create_mock_image_service()
-        self.mock_fetch_pokemon_use_case = self.create_mock_fetch_pokemon_use_case()
-
-        self.pokedex_view = PokedexView(
-            parent=self.mock_parent,
-            navigator=self.mock_navigator,
-            image_service=self.mock_image_service,
-            fetch_pokemon_use_case=self.mock_fetch_pokemon_use_case,
-        )
+_EXPECTED_BASE_CALL_25 = call(image_url="https://example.com/pikachu.png", pokemon_name="25")
+_EXPECTED_SHINY_CALL_25 = call(image_url="https://example.com/pikachu_shiny.png", pokemon_name="25")
+_EXPECTED_BASE_CALL_UNKNOWN = call(image_url="https://example.com/image.png", pokemon_name="Unknown")
 
-    def test_initialization(self) -> None:
-        """Test that the view initializes correctly."""
-        self.assertIs(self.pokedex_view.image_service, self.mock_image_service)
-        self.assertIs(self.pokedex_view.fetch_pokemon_use_case, self.mock_fetch_pokemon_use_case)
-        self.assertIsNone(self.pokedex_view._current_search_thread)
-        self.assertIsNone(self.pokedex_view._current_base_image_thread)
-        self.assertIsNone(self.pokedex_view._current_shiny_image_thread)
-        self.assertFalse(self.pokedex_view._search_cancelled)
-        self.assertFalse(self.pokedex_view._base_image_search_cancelled)
-        self.assertFalse(self.pokedex_view._shiny_image_search_cancelled)
-
-    def test_fetch_pokemon_base_image_with_valid_data(self) -> None:
-        """Test fetching Pokemon base image with valid data containing image URL."""
-        image_url = "https://example.com/pikachu.png"
-        pokemon_name = "Pikachu"
 
-        mock_thread = Mock()
-        self.mock_image_service.fetch_image_async.return_value = mock_thread
+@pytest.fixture
+def mock_thread_cls() -> Iterator[Mock]:
+    """Fixture replacing threading.Thread for tests that trigger the view's background search thread.
 
-        self.pokedex_view._fetch_pokemon_base_image(image_url=image_url, pokemon_name=pokemon_name)
+    The view calls threading.Thread through the threading module, so this patches the attribute on that module
+    and is process-wide for the duration of the test.
+    """
+    with patch("threading.Thread") as mock_thread_cls:
+        mock_thread_cls.return_value.is_alive.return_value = False
+        yield mock_thread_cls
 
-        self.mock_image_service.fetch_image_async.assert_called_once()
-        call_args = self.mock_image_service.fetch_image_async.call_args
-        self.assertEqual(call_args.kwargs["image_url"], image_url)
-        self.assertEqual(call_args.kwargs["on_success"], self.pokedex_view._on_base_image_success)
-        self.assertEqual(call_args.kwargs["on_error"], self.pokedex_view._on_base_image_error)
-        self.assertEqual(self.pokedex_view._current_pokemon_name, pokemon_name)
 
-    def test_fetch_pokemon_shiny_image_with_valid_data(self) -> None:
-        image_url = "https://example.com/pikachu_shiny.png"
-        pokemon_name = "Pikachu"
+class TestPokedexView:
+    """Test suite for PokedexView."""
 
+    def test_initialization(
+        self, pokedex_view: PokedexView, mock_image_service: Mock, mock_fetch_pokemon_use_case: Mock
+    ) -> None:
+        """Test that the view initializes correctly."""
+        assert pokedex_view.image_service is mock_image_service
+        assert pokedex_view.fetch_pokemon_use_case is mock_fetch_pokemon_use_case
+        assert pokedex_view._current_search_thread is None
+        assert pokedex_view._current_base_image_thread is None
+        assert pokedex_view._current_shiny_image_thread is None
+        assert not pokedex_view._search_cancelled
+        assert not pokedex_view._base_image_search_cancelled
+        assert not pokedex_view._shiny_image_search_cancelled
+
+    @pytest.mark.parametrize(
+        "method,on_success,on_error,thread_attr,image_url",
+        [
+            (
+                "_fetch_pokemon_base_image",
+                "_on_base_image_success",
+                "_on_base_image_error",
+                "_current_base_image_thread",
+                "https://example.com/pikachu.png",
+            ),
+            (
+                "_fetch_pokemon_shiny_image",
+                "_on_shiny_image_success",
+                "_on_shiny_image_error",
+                "_current_shiny_image_thread",
+                "https://example.com/pikachu_shiny.png",
+            ),
+        ],
+    )
+    def test_fetch_pokemon_image_with_valid_data(
+        self,
+        pokedex_view: PokedexView,
+        mock_image_service: Mock,
+        method: str,
+        on_success: str,
+        on_error: str,
+        thread_attr: str,
+        image_url: str,
+    ) -> None:
+        """Test fetching a Pokemon image wires the image service to the matching callbacks."""
         mock_thread = Mock()
-        self.mock_image_service.fetch_image_async.return_value = mock_thread
-
-        self.pokedex_view._fetch_pokemon_shiny_image(image_url=image_url, pokemon_name=pokemon_name)
-
-        self.mock_image_service.fetch_image_async.assert_called_once()
-        call_args = self.mock_image_service.fetch_image_async.call_args
-        self.assertEqual(call_args.kwargs["image_url"], image_url)
-        self.assertEqual(call_args.kwargs["on_success"], self.pokedex_view._on_shiny_image_success)
-        self.assertEqual(call_args.kwargs["on_error"], self.pokedex_view._on_shiny_image_error)
-        self.assertEqual(self.pokedex_view._current_pokemon_name, pokemon_name)
-
-    def test_on_pokemon_data_success_with_both_images(self) -> None:
-        mock_data: dict[str, Any] = {
-            "id": 25,
-            POKEMON_ASSETS_KEY: {
-                POKEMON_IMAGE_KEY: "https://example.com/pikachu.png",
-                POKEMON_SHINY_IMAGE_KEY: "https://example.com/pikachu_shiny.png",
-            },
-        }
-
-        self.pokedex_view.frame = Mock()
-        with (
-            patch.object(self.pokedex_view, "_fetch_pokemon_base_image") as mock_fetch_base,
-            patch.object(self.pokedex_view, "_fetch_pokemon_shiny_image") as mock_fetch_shiny,
-        ):
-            self.pokedex_view._on_pokemon_data_success(mock_data)
-
-            mock_fetch_base.assert_called_once_with(
-                image_url=mock_data[POKEMON_ASSETS_KEY][POKEMON_IMAGE_KEY], pokemon_name="25"
-            )
-            mock_fetch_shiny.assert_called_once_with(
-                image_url=mock_data[POKEMON_ASSETS_KEY][POKEMON_SHINY_IMAGE_KEY], pokemon_name="25"
-            )
-
-    def test_on_pokemon_data_success_with_base_image_only(self) -> None:
-        """Test handling successful Pokemon data with only base image URL."""
-        mock_data: dict[str, Any] = {
-            "id": 25,
-            POKEMON_ASSETS_KEY: {POKEMON_IMAGE_KEY: "https://example.com/pikachu.png"},
-        }
-
-        self.pokedex_view.frame = Mock()
-        with (
-            patch.object(self.pokedex_view, "_fetch_pokemon_base_image") as mock_fetch_base,
-            patch.object(self.pokedex_view, "_fetch_pokemon_shiny_image") as mock_fetch_shiny,
-        ):
-            self.pokedex_view._on_pokemon_data_success(mock_data)
-
-            mock_fetch_base.assert_called_once_with(
-                image_url=mock_data[POKEMON_ASSETS_KEY][POKEMON_IMAGE_KEY], pokemon_name="25"
-            )
-            mock_fetch_shiny.assert_not_called()
-
-    def test_on_pokemon_data_success_without_images(self) -> None:
-        """Test handling successful Pokemon data without image URLs."""
-        mock_data = {"name": "Pikachu"}
-
-        self.pokedex_view.frame = Mock()
-        with (
-            patch.object(self.pokedex_view, "_fetch_pokemon_base_image") as mock_fetch_base,
-            patch.object(self.pokedex_view, "_fetch_pokemon_shiny_image") as mock_fetch_shiny,
-        ):
-            self.pokedex_view._on_pokemon_data_success(mock_data)
-
-            mock_fetch_base.assert_not_called()
-            mock_fetch_shiny.assert_not_called()
-
-    def test_on_pokemon_data_success_with_missing_id(self) -> None:
-        """Test handling successful Pokemon data without id field."""
-        mock_data = {POKEMON_ASSETS_KEY: {POKEMON_IMAGE_KEY: "https://example.com/image.png"}}
-
-        self.pokedex_view.frame = Mock()
-        with patch.object(self.pokedex_view, "_fetch_pokemon_base_image") as mock_fetch_base:
-            self.pokedex_view._on_pokemon_data_success(mock_data)
-
-            mock_fetch_base.assert_called_once_with(
-                image_url=mock_data[POKEMON_ASSETS_KEY][POKEMON_IMAGE_KEY], pokemon_name="Unknown"
-            )
-
-    def test_on_pokemon_data_success_with_empty_data(self) -> None:
-        """Test handling empty Pokemon data dictionary."""
-        mock_data: dict[str, Any] = {}
-
-        self.pokedex_view.frame = Mock()
-        with (
-            patch.object(self.pokedex_view, "_fetch_pokemon_base_image") as mock_fetch_base,
-            patch.object(self.pokedex_view, "_fetch_pokemon_shiny_image") as mock_fetch_shiny,
-        ):
-            self.pokedex_view._on_pokemon_data_success(mock_data)
-
-            mock_fetch_base.assert_not_called()
-            mock_fetch_shiny.assert_not_called()
-
-    def test_display_pokemon_base_image_with_processed_image(self) -> None:
-        """Test displaying a processed base image in the UI."""
-        mock_processed_image = Mock(spec=ProcessedImage)
+        captured: dict[str, Any] = {}
+
+        def _record(**kwargs: Any) -> Mock:
+            captured.update(kwargs)
+            return mock_thread
+
+        mock_image_service.fetch_image_async.side_effect = _record
+
+        getattr(pokedex_view, method)(image_url=image_url, pokemon_name="Pikachu")
+
+        mock_image_service.fetch_image_async.assert_called_once()
+        assert captured["image_url"] == image_url
+        assert captured["on_success"] == getattr(pokedex_view, on_success)
+        assert captured["on_error"] == getattr(pokedex_view, on_error)
+        assert getattr(pokedex_view, thread_attr) is mock_thread
+        assert pokedex_view._current_pokemon_name == "Pikachu"
+
+    @pytest.mark.parametrize(
+        "data,expected_base,expected_shiny",
+        [
+            (_DATA_BOTH, _EXPECTED_BASE_CALL_25, _EXPECTED_SHINY_CALL_25),
+            (_DATA_BASE_ONLY, _EXPECTED_BASE_CALL_25, None),
+            (_DATA_NO_IMAGES, None, None),
+            (_DATA_MISSING_ID, _EXPECTED_BASE_CALL_UNKNOWN, None),
+            (_DATA_EMPTY, None, None),
+        ],
+        ids=["both_images", "base_image_only", "no_images", "missing_id", "empty_data"],
+    )
+    def test_on_pokemon_data_success_fetches_available_images(
+        self, pokedex_view: PokedexView, data: Mapping[str, Any], expected_base: Any, expected_shiny: Any
+    ) -> None:
+        """Test that successful Pokemon data triggers a fetch for each image URL it contains."""
+        # The fixture builds a fresh view per test, so the methods can be replaced without restoring them.
+        mock_fetch_base = pokedex_view._fetch_pokemon_base_image = Mock()  # type: ignore[method-assign]
+        mock_fetch_shiny = pokedex_view._fetch_pokemon_shiny_image = Mock()  # type: ignore[method-assign]
+        pokedex_view.frame = SimpleNamespace(after=MagicMock())  # type: ignore[assignment]
+
+        pokedex_view._on_pokemon_data_success(data)  # type: ignore[arg-type]
+
+        # call_args is None when the mock was never called, which matches the None cases.
+        assert mock_fetch_base.call_args == expected_base
+        assert mock_fetch_base.call_count == (expected_base is not None)
+        assert mock_fetch_shiny.call_args == expected_shiny
+        assert mock_fetch_shiny.call_count == (expected_shiny is not None)
+
+    @pytest.mark.parametrize(
+        "method,label,expected_status",
+        [
+            ("_display_pokemon_base_image", "base_image_label", "Base image loaded for Pikachu!"),
+            ("_display_pokemon_shiny_image", "shiny_image_label", "Shiny image loaded for Pikachu!"),
+        ],
+    )
+    def test_display_pokemon_image_with_processed_image(
+        self, bare_view: PokedexView, mock_navigator: Mock, method: str, label: str, expected_status: str
+    ) -> None:
+        """Test displaying a processed image in the matching UI label."""
+        mock_processed_image = sentinel.processed_image
+        mock_label = SimpleNamespace(config=MagicMock())
+        setattr(bare_view, label, mock_label)
+
+        getattr(bare_view, method)(image=mock_processed_image, pokemon_name="Pikachu")
+
+        mock_label.config.assert_called_once_with(image=mock_processed_image, text="")
+        assert mock_label.image == mock_processed_image
+        mock_navigator.update_status.assert_called_once_with(message=expected_status)
+
+    @pytest.mark.parametrize(
+        "success_method,display_method",
+        [
+            ("_on_base_image_success", "_display_pokemon_base_image"),
+            ("_on_shiny_image_success", "_display_pokemon_shiny_image"),
+        ],
+    )
+    def test_on_image_success_callback(
+        self, pokedex_view: PokedexView, success_method: str, display_method: str
+    ) -> None:
+        """Test that an image success callback schedules the matching display method on the UI thread."""
+        mock_processed_image = sentinel.processed_image
         pokemon_name = "Pikachu"
-        self.pokedex_view.base_image_label = Mock()
-
-        self.pokedex_view._display_pokemon_base_image(image=mock_processed_image, pokemon_name=pokemon_name)
-
-        self.pokedex_view.base_image_label.config.assert_called_once_with(image=mock_processed_image, text="")
-        self.assertEqual(self.pokedex_view.base_image_label.image, mock_processed_image)
-        self.mock_navigator.update_status.assert_called_once_with(message="Base image loaded for Pikachu!")
-
-    def test_display_pokemon_shiny_image_with_processed_image(self) -> None:
-        """Test displaying a processed shiny image in the UI."""
-        mock_processed_image = Mock(spec=ProcessedImage)
-        pokemon_name = "Pikachu"
-
-        self.pokedex_view.shiny_image_label = Mock()
-
-        self.pokedex_view._display_pokemon_shiny_image(image=mock_processed_image, pokemon_name=pokemon_name)
+        pokedex_view._current_pokemon_name = pokemon_name
+        frame = SimpleNamespace(after=MagicMock())
+        pokedex_view.frame = frame  # type: ignore[assignment]
+        mock_display = Mock()
+        setattr(pokedex_view, display_method, mock_display)
+
+        getattr(pokedex_view, success_method)(mock_processed_image)
+        frame.after.assert_called_once()
+        partial_func: partial[None] = frame.after.call_args[0][1]
+        assert partial_func.func is mock_display
+        assert partial_func.keywords == {"image": mock_processed_image, "pokemon_name": pokemon_name}
+        mock_display.assert_not_called()
+
+    def test_on_search_click_starts_search_thread(self, pokedex_view: PokedexView, mock_thread_cls: Mock) -> None:
+        """Test that a search click starts a background search thread for the entered name."""
+        pokedex_view.search_entry = Mock()
+        pokedex_view.search_entry.get.return_value = "  Pikachu "
+        pokedex_view._clear_images = Mock()  # type: ignore[method-assign]
+
+        pokedex_view._on_search_click()
+
+        thread: Mock = mock_thread_cls.return_value
+        mock_thread_cls.assert_called_once_with(
+            target=pokedex_view._search_pokemon_thread, args=("pikachu",), daemon=True
+        )
+        assert pokedex_view._current_search_thread is thread
+        thread.start.assert_called_once_with()
+        assert not pokedex_view._search_cancelled
 
-        self.pokedex_view.shiny_image_label.config.assert_called_once_with(image=mock_processed_image, text="")
-        self.assertEqual(self.pokedex_view.shiny_image_label.image, mock_processed_image)
-        self.mock_navigator.update_status.assert_called_once_with(message="Shiny image loaded for Pikachu!")
+    def test_clear_images(self, bare_view: PokedexView) -> None:
+        bare_view.base_image_label = mock_base_label = SimpleNamespace(config=MagicMock())  # type: ignore[assignment]
+        bare_view.shiny_image_label = mock_shiny_label = SimpleNamespace(config=MagicMock())  # type: ignore[assignment]
 
-    def test_on_base_image_success_callback(self) -> None:
-        """Test the base image success callback from the image service."""
-        mock_processed_image = Mock(spec=ProcessedImage)
-        pokemon_name = "Pikachu"
+        bare_view._clear_images()
 
-        self.pokedex_view._current_pokemon_name = pokemon_name
+        mock_base_label.config.assert_called_once_with(image="", text="No image loaded.")
+        mock_shiny_label.config.assert_called_once_with(image="", text="No image loaded.")
 
-        self.pokedex_view.frame = Mock()
+    def test_cancel_current_image_searches(self, bare_view: PokedexView) -> None:
+        bare_view._current_base_image_thread = Mock()
+        bare_view._current_base_image_thread.is_alive.return_value = True
+        bare_view._current_shiny_image_thread = Mock()
+        bare_view._current_shiny_image_thread.is_alive.return_value = True
 
-        with patch.object(self.pokedex_view, "_display_pokemon_base_image") as mock_display:
-            self.pokedex_view._on_base_image_success(mock_processed_image)
-            self.pokedex_view.frame.after.assert_called_once()
-            lambda_func: Callable[[], None] = self.pokedex_view.frame.after.call_args[0][1]  # type: ignore[index]
-            lambda_func()
-            mock_display.assert_called_once_with(image=mock_processed_image, pokemon_name=pokemon_name)
+        bare_view._cancel_current_image_searches()
 
-    def test_on_shiny_image_success_callback(self) -> None:
-        """Test the shiny image success callback from the image service."""
-        mock_processed_image = Mock(spec=ProcessedImage)
-        pokemon_name = "Pikachu"
-        self.pokedex_view._current_pokemon_name = pokemon_name
-        self.pokedex_view.frame = Mock()
-        with patch.object(self.pokedex_view, "_display_pokemon_shiny_image") as mock_display:
-            self.pokedex_view._on_shiny_image_success(mock_processed_image)
-            self.pokedex_view.frame.after.assert_called_once()
-            lambda_func: Callable[[], None] = self.pokedex_view.frame.after.call_args[0][1]  # type: ignore[index]
-            lambda_func()
-            mock_display.assert_called_once_with(image=mock_processed_image, pokemon_name=pokemon_name)
-
-    def test_clear_images(self) -> None:
-        self.pokedex_view.base_image_label = Mock()
-        self.pokedex_view.shiny_image_label = Mock()
-
-        self.pokedex_view._clear_images()
-
-        self.pokedex_view.base_image_label.config.assert_called_once_with(image="", text="No image loaded.")
-        self.pokedex_view.shiny_image_label.config.assert_called_once_with(image="", text="No image loaded.")
-
-    def test_cancel_current_image_searches(self) -> None:
-        self.pokedex_view._current_base_image_thread = Mock()
-        self.pokedex_view._current_base_image_thread.is_alive.return_value = True
-        self.pokedex_view._current_shiny_image_thread = Mock()
-        self.pokedex_view._current_shiny_image_thread.is_alive.return_value = True
-
-        self.pokedex_view._cancel_current_image_searches()
-
-        self.assertTrue(self.pokedex_view._base_image_search_cancelled)
-        self.assertTrue(self.pokedex_view._shiny_image_search_cancelled)
+        assert bare_view._base_image_search_cancelled
+        assert bare_view._shiny_image_search_cancelled
@@ -0,0 +1,20 @@
+import pytest
+
+from src.domain.entities.move import Move
+from src.domain.value_objects.types import Type
+
+
+@pytest.fixture(scope="session")
+def sample_moves() -> dict[str, tuple[Move, ...]]:
+    """Fixture providing immutable tuples of sample quick and charge moves, built once per session."""
+    quick_moves = (
+        Move(internal_id="QUICK_ATTACK", name="Quick Attack", power=8, energy=10, duration=1500, type=Type.NORMAL),
+        Move(internal_id="THUNDERBOLT", name="Thunderbolt", power=12, energy=16, duration=1100, type=Type.ELECTRIC),
+    )
+
+    charge_moves = (
+        Move(internal_id="BODY_SLAM", name="Body Slam", power=60, energy=35, duration=1900, type=Type.NORMAL),
+        Move(internal_id="THUNDER", name="Thunder", power=100, energy=60, duration=2400, type=Type.ELECTRIC),
+    )
+
+    return {"quick": quick_moves, "charge": charge_moves}
@@ -1,115 +1,68 @@
+import re
+from dataclasses import fields, replace
+from typing import Any
+
 import pytest
 
 from src.domain.entities.move import Move
 from src.domain.value_objects.types import Type
 
+_ERR_POWER = re.compile("power must be greater than 0")
+_ERR_DURATION = re.compile("duration must be greater than 0")
+_ERR_ENERGY = re.compile("energy cannot be zero")
+_ERR_TYPE = re.compile("type must be a valid Type")
+
+_MOVE_FIELDS_BY_NAME = {field.name: field for field in fields(Move)}
+_BASE_MOVE_KWARGS: dict[str, Any] = {
+    "internal_id": "INVALID_MOVE",
+    "name": "Invalid Move",
+    "power": 50,
+    "energy": 25,
+    "duration": 1500,
+    "type": Type.NORMAL,
+}
+_INVALID_MOVE_CASES = [
+    pytest.param("power", 0, _ERR_POWER, id="power_zero"),
+    pytest.param("power", -10, _ERR_POWER, id="power_negative"),
+    pytest.param("duration", 0, _ERR_DURATION, id="duration_zero"),
+    pytest.param("duration", -100, _ERR_DURATION, id="duration_negative"),
+    pytest.param("energy", 0, _ERR_ENERGY, id="energy_zero"),
+    pytest.param("type", "InvalidType", _ERR_TYPE, id="invalid_type"),
+]
+
 
 class TestMove:
     """Test suite for Move entity."""
 
-    @pytest.mark.parametrize(
-        "energy",
-        [-50, 55],
-    )
-    def test_move_creation_with_valid_data(self, energy: int) -> None:
-        """Test that a Move can be created with valid attributes and any integer energy value."""
+    def test_move_creation_with_valid_data(self) -> None:
+        """Test that a Move can be created with valid attributes."""
         move = Move(
-            internal_id="THUNDERBOLT",
-            name="Thunderbolt",
-            power=90,
-            energy=energy,
-            duration=2500,
-            type=Type.ELECTRIC,
+            internal_id="THUNDERBOLT", name="Thunderbolt", power=90, energy=55, duration=2500, type=Type.ELECTRIC
         )
 
         assert move.internal_id == "THUNDERBOLT"
         assert move.name == "Thunderbolt"
         assert move.power == 90
-        assert move.energy == energy
+        assert move.energy == 55
         assert move.duration == 2500
         assert move.type == Type.ELECTRIC
 
-    @pytest.mark.parametrize(
-        "move_data,expected_error",
-        [
-            # Zero power
-            (
-                {
-                    "internal_id": "THUNDER_WAVE",
-                    "name": "Thunder Wave",
-                    "power": 0,
-                    "energy": 45,
-                    "duration": 2900,
-                    "type": Type.ELECTRIC,
-                },
-                "power must be greater than 0",
-            ),
-            # Negative power
-            (
-                {
-                    "internal_id": "SPECIAL_MOVE",
-                    "name": "Special Move",
-                    "power": -10,
-                    "energy": 35,
-                    "duration": 1500,
-                    "type": Type.NORMAL,
-                },
-                "power must be greater than 0",
-            ),
-            # Zero duration
-            (
-                {
-                    "internal_id": "INSTANT_MOVE",
-                    "name": "Instant Move",
-                    "power": 50,
-                    "energy": 25,
-                    "duration": 0,
-                    "type": Type.NORMAL,
-                },
-                "duration must be greater than 0",
-            ),
-            # Negative duration
-            (
-                {
-                    "internal_id": "REVERSE_MOVE",
-                    "name": "Reverse Move",
-                    "power": 50,
-                    "energy": 25,
-                    "duration": -100,
-                    "type": Type.NORMAL,
-                },
-                "duration must be greater than 0",
-            ),
-            # Zero energy
-            (
-                {
-                    "internal_id": "ZERO_ENERGY_MOVE",
-                    "name": "Zero Energy Move",
-                    "power": 50,
-                    "energy": 0,
-                    "duration": 1500,
-                    "type": Type.NORMAL,
-                },
-                "energy cannot be zero",
-            ),
-            # Invalid type
-            (
-                {
-                    "internal_id": "INVALID_MOVE",
-                    "name": "Invalid Move",
-                    "power": 50,
-                    "energy": 25,
-                    "duration": 1500,
-                    "type": "InvalidType",
-                },
-                "type must be a valid Type",
-            ),
-        ],
-    )
-    def test_move_creation_with_invalid_data_raises_error(self, move_data: dict, expected_error: str) -> None:
-        """Test that creating a Move with invalid data raises appropriate ValueError."""
+    @pytest.mark.parametrize("energy", [-50, 55], ids=["energy_generating", "energy_consuming"])
+    def test_move_creation_accepts_any_nonzero_energy(self, energy: int) -> None:
+        """Test that a Move accepts both negative and positive energy values."""
+        move = Move(
+            internal_id="THUNDERBOLT", name="Thunderbolt", power=90, energy=energy, duration=2500, type=Type.ELECTRIC
+        )
+
+        assert move.energy == energy
+
+    @pytest.mark.parametrize("field,value,expected_error", _INVALID_MOVE_CASES)
+    def test_move_creation_with_invalid_data_raises_error(
+        self, field: str, value: Any, expected_error: re.Pattern[str]
+    ) -> None:
+        """Test that creating a Move with one invalid field raises appropriate ValueError."""
         with pytest.raises(ValueError, match=expected_error):
-            Move(**move_data)  # type: ignore
+            Move(**{**_BASE_MOVE_KWARGS, field: value})
 
     def test_move_with_negative_energy(self) -> None:
         """Test that a Move can have negative energy (energy generation)."""
@@ -134,8 +87,20 @@ class TestMove:
         assert move.energy == 1
         assert move.duration == 1
 
+    def test_move_replace_returns_updated_copy(self) -> None:
+        """Test that dataclasses.replace returns an updated copy and leaves the original Move untouched."""
+        move = Move(
+            internal_id="THUNDERBOLT", name="Thunderbolt", power=90, energy=55, duration=2500, type=Type.ELECTRIC
+        )
+
+        updated = replace(move, power=95)
+
+        assert updated.power == 95
+        assert move.power == 90
+        assert updated is not move
+
     def test_move_mutability(self) -> None:
-        """Test that Move attributes can be modified (dataclass behavior)."""
+        """Test that Move attributes can be modified in place (dataclass behavior)."""
         move = Move(
             internal_id="THUNDERBOLT", name="Thunderbolt", power=90, energy=55, duration=2500, type=Type.ELECTRIC
         )
@@ -145,9 +110,4 @@ class TestMove:
 
     def test_move_field_metadata(self) -> None:
         """Test that duration field has correct metadata."""
-        from dataclasses import fields
-
-        move_fields = fields(Move)
-        duration_field = next(field for field in move_fields if field.name == "duration")
-
-        assert duration_field.metadata == {"unit": "milliseconds"}
+        assert _MOVE_FIELDS_BY_NAME["duration"].metadata == {"unit": "milliseconds"}
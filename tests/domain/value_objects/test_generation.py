@@ -6,29 +6,24 @@ from src.domain.value_objects.generation import Generation
 class TestGeneration:
     """Test suite for Generation value object."""
 
-    def test_generation_values_are_correct(self) -> None:
-        """Test that Generation enum has the correct values for each generation."""
-        assert Generation.KANTO == 1
-        assert Generation.JOHTO == 2
-        assert Generation.HOENN == 3
-        assert Generation.SINNOH == 4
-        assert Generation.UNOVA == 5
-        assert Generation.KALOS == 6
-        assert Generation.ALOLA == 7
-        assert Generation.GALAR == 8
-        assert Generation.PALDEA == 9
-
-    def test_generation_names_are_correct(self) -> None:
-        """Test that Generation enum names match expected region names."""
-        assert Generation.KANTO.name == "KANTO"
-        assert Generation.JOHTO.name == "JOHTO"
-        assert Generation.HOENN.name == "HOENN"
-        assert Generation.SINNOH.name == "SINNOH"
-        assert Generation.UNOVA.name == "UNOVA"
-        assert Generation.KALOS.name == "KALOS"
-        assert Generation.ALOLA.name == "ALOLA"
-        assert Generation.GALAR.name == "GALAR"
-        assert Generation.PALDEA.name == "PALDEA"
+    @pytest.mark.parametrize(
+        "name,value",
+        [
+            pytest.param("KANTO", 1, id="KANTO"),
+            pytest.param("JOHTO", 2, id="JOHTO"),
+            pytest.param("HOENN", 3, id="HOENN"),
+            pytest.param("SINNOH", 4, id="SINNOH"),
+            pytest.param("UNOVA", 5, id="UNOVA"),
+            pytest.param("KALOS", 6, id="KALOS"),
+            pytest.param("ALOLA", 7, id="ALOLA"),
+            pytest.param("GALAR", 8, id="GALAR"),
+            pytest.param("PALDEA", 9, id="PALDEA"),
+        ],
+    )
+    def test_generation_name_value_round_trip(self, name: str, value: int) -> None:
+        """Test that each Generation member has the expected name and value, and resolves both ways."""
+        assert Generation[name] == value
+        assert Generation(value).name == name
 
     def test_generation_count(self) -> None:
         """Test that we have exactly 9 generations defined."""
@@ -53,11 +48,6 @@ class TestGeneration:
         assert 0 not in Generation
         assert 10 not in Generation
 
-    def test_generation_from_value(self) -> None:
-        """Test creating Generation instances from their numeric values."""
-        assert Generation(1) == Generation.KANTO
-        assert Generation(9) == Generation.PALDEA
-
     def test_invalid_generation_value_raises_error(self) -> None:
         """Test that invalid generation values raise ValueError."""
         with pytest.raises(ValueError):
@@ -2,30 +2,60 @@ import pytest
 
 from src.domain.value_objects.types import Type
 
+_EXPECTED_TYPE_VALUES = frozenset(
+    {
+        "Bug",
+        "Dark",
+        "Dragon",
+        "Electric",
+        "Fairy",
+        "Fighting",
+        "Fire",
+        "Flying",
+        "Ghost",
+        "Grass",
+        "Ground",
+        "Ice",
+        "Normal",
+        "Poison",
+        "Psychic",
+        "Rock",
+        "Steel",
+        "Water",
+    }
+)
+
 
 class TestType:
     """Test suite for Type value object."""
 
-    def test_type_values_are_correct(self) -> None:
-        """Test that Type enum has the correct string values."""
-        assert Type.BUG == "Bug"
-        assert Type.DARK == "Dark"
-        assert Type.DRAGON == "Dragon"
-        assert Type.ELECTRIC == "Electric"
-        assert Type.FAIRY == "Fairy"
-        assert Type.FIGHTING == "Fighting"
-        assert Type.FIRE == "Fire"
-        assert Type.FLYING == "Flying"
-        assert Type.GHOST == "Ghost"
-        assert Type.GRASS == "Grass"
-        assert Type.GROUND == "Ground"
-        assert Type.ICE == "Ice"
-        assert Type.NORMAL == "Normal"
-        assert Type.POISON == "Poison"
-        assert Type.PSYCHIC == "Psychic"
-        assert Type.ROCK == "Rock"
-        assert Type.STEEL == "Steel"
-        assert Type.WATER == "Water"
+    @pytest.mark.parametrize(
+        "type_member,expected_value",
+        [
+            pytest.param(Type.BUG, "Bug", id="BUG"),
+            pytest.param(Type.DARK, "Dark", id="DARK"),
+            pytest.param(Type.DRAGON, "Dragon", id="DRAGON"),
+            pytest.param(Type.ELECTRIC, "Electric", id="ELECTRIC"),
+            pytest.param(Type.FAIRY, "Fairy", id="FAIRY"),
+            pytest.param(Type.FIGHTING, "Fighting", id="FIGHTING"),
+            pytest.param(Type.FIRE, "Fire", id="FIRE"),
+            pytest.param(Type.FLYING, "Flying", id="FLYING"),
+            pytest.param(Type.GHOST, "Ghost", id="GHOST"),
+            pytest.param(Type.GRASS, "Grass", id="GRASS"),
+            pytest.param(Type.GROUND, "Ground", id="GROUND"),
+            pytest.param(Type.ICE, "Ice", id="ICE"),
+            pytest.param(Type.NORMAL, "Normal", id="NORMAL"),
+            pytest.param(Type.POISON, "Poison", id="POISON"),
+            pytest.param(Type.PSYCHIC, "Psychic", id="PSYCHIC"),
+            pytest.param(Type.ROCK, "Rock", id="ROCK"),
+            pytest.param(Type.STEEL, "Steel", id="STEEL"),
+            pytest.param(Type.WATER, "Water", id="WATER"),
+        ],
+    )
+    def test_type_values_are_correct(self, type_member: Type, expected_value: str) -> None:
+        """Test that each Type enum member has the correct string value and resolves back from it."""
+        assert type_member == expected_value
+        assert Type(expected_value) is type_member
 
     def test_type_names_are_correct(self) -> None:
         """Test that Type enum names are properly capitalized."""
@@ -40,34 +70,8 @@ class TestType:
 
     def test_all_pokemon_types_included(self) -> None:
         """Test that all traditional Pokemon types are included."""
-        expected_types = {
-            "Bug",
-            "Dark",
-            "Dragon",
-            "Electric",
-            "Fairy",
-            "Fighting",
-            "Fire",
-            "Flying",
-            "Ghost",
-            "Grass",
-            "Ground",
-            "Ice",
-            "Normal",
-            "Poison",
-            "Psychic",
-            "Rock",
-            "Steel",
-            "Water",
-        }
         actual_types = {t.value for t in Type}
-        assert actual_types == expected_types
-
-    def test_type_string_equality(self) -> None:
-        """Test that Type values can be compared with strings."""
-        assert Type.FIRE == "Fire"
-        assert Type.WATER == "Water"
-        assert Type.ELECTRIC != "electric"  # Case sensitive
+        assert actual_types == _EXPECTED_TYPE_VALUES
 
     def test_type_membership(self) -> None:
         """Test that string values are correctly identified as Type members."""
@@ -76,12 +80,6 @@ class TestType:
         assert "fire" not in Type  # Case sensitive
         assert "Unknown" not in Type
 
-    def test_type_from_value(self) -> None:
-        """Test creating Type instances from their string values."""
-        assert Type("Fire") == Type.FIRE
-        assert Type("Water") == Type.WATER
-        assert Type("Electric") == Type.ELECTRIC
-
     def test_invalid_type_value_raises_error(self) -> None:
         """Test that invalid type values raise ValueError."""
         with pytest.raises(ValueError):
@@ -113,6 +111,5 @@ class TestType:
 
     def test_type_case_sensitivity(self) -> None:
         """Test that Type enum is case sensitive for values."""
-        assert Type.FIRE.value == "Fire"
         assert Type.FIRE.value != "fire"
         assert Type.FIRE.value != "FIRE"
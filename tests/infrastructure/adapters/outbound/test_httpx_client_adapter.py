@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock, Mock, patch
+import json
+from typing import Any, Iterator
 
 import httpx
 import pytest
@@ -7,238 +8,128 @@ from src.domain.errors.http import HttpClientError
 from src.infrastructure.adapters.outbound.httpx_client_adapter import HttpxClientAdapter
 
 
-class TestHttpxClientAdapter:
-    """Test suite for HttpxClientAdapter."""
-
-    def test_sync_get_success(self) -> None:
-        """Test successful synchronous GET request."""
-        mock_response_data = {"id": 1, "name": "Test name"}
-
-        with patch("httpx.Client") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-
-            mock_response = Mock()
-            mock_response.json.return_value = mock_response_data
-            mock_response.raise_for_status.return_value = None
-            mock_client.get.return_value = mock_response
-
-            adapter = HttpxClientAdapter()
-
-            with adapter:
-                result = adapter.get(url="https://example.com")
-
-            assert result == mock_response_data
-            mock_client.get.assert_called_once_with(url="https://example.com", headers=None, params=None, timeout=30.0)
-
-    @pytest.mark.asyncio
-    async def test_async_get_success(self) -> None:
-        """Test successful asynchronous GET request."""
-        mock_response_data = {"id": 1, "name": "Test name"}
-
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value = mock_client
-
-            mock_response = Mock()
-            mock_response.json.return_value = mock_response_data
-            mock_response.raise_for_status.return_value = None
-            mock_client.get.return_value = mock_response
-
-            adapter = HttpxClientAdapter()
-
-            async with adapter:
-                result = await adapter.get_async(url="https://example.com")
-
-            assert result == mock_response_data
-            mock_client.get.assert_called_once_with(url="https://example.com", headers=None, params=None, timeout=30.0)
-
-    def test_sync_get_binary_success(self) -> None:
-        """Test successful synchronous binary GET request."""
-        mock_binary_data = b"fake image data"
-
-        with patch("httpx.Client") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-
-            mock_response = Mock()
-            mock_response.content = mock_binary_data
-            mock_response.raise_for_status.return_value = None
-            mock_client.get.return_value = mock_response
-
-            adapter = HttpxClientAdapter()
-
-            with adapter:
-                result = adapter.get_binary(url="https://example.com/image.png")
-
-            assert result == mock_binary_data
-            mock_client.get.assert_called_once_with(
-                url="https://example.com/image.png", headers=None, params=None, timeout=30.0
-            )
-
-    def test_sync_get_binary_with_parameters(self) -> None:
-        """Test synchronous binary GET request with headers, params, and custom timeout."""
-        mock_binary_data = b"test binary content"
-        headers = {"User-Agent": "Test Bot"}
-        params = {"size": "large"}
-        timeout = 20.0
-
-        with patch("httpx.Client") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-
-            mock_response = Mock()
-            mock_response.content = mock_binary_data
-            mock_response.raise_for_status.return_value = None
-            mock_client.get.return_value = mock_response
-
-            adapter = HttpxClientAdapter()
-
-            with adapter:
-                result = adapter.get_binary(
-                    url="https://api.example.com/download", headers=headers, params=params, timeout=timeout
-                )
-
-            assert result == mock_binary_data
-            mock_client.get.assert_called_once_with(
-                url="https://api.example.com/download", headers=headers, params=params, timeout=timeout
-            )
-
-    def test_sync_get_binary_http_error(self) -> None:
-        """Test synchronous binary GET request that returns HTTP error status."""
-        with patch("httpx.Client") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-
-            mock_response = Mock()
-            mock_response.status_code = 404
-            mock_response.text = "Image Not Found"
-
-            http_error = httpx.HTTPStatusError(message="404 Not Found", request=Mock(), response=mock_response)
-            mock_response.raise_for_status.side_effect = http_error
-            mock_client.get.return_value = mock_response
-
-            adapter = HttpxClientAdapter()
-
-            with adapter:
-                with pytest.raises(HttpClientError) as exc_info:
-                    adapter.get_binary(url="https://example.com/nonexistent.png")
-
-            assert exc_info.value.status_code == 404
-            assert "404" in str(exc_info.value)
-
-    def test_sync_get_binary_request_error(self) -> None:
-        """Test synchronous binary GET request that fails due to network error."""
-        with patch("httpx.Client") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-
-            request_error = httpx.RequestError("Connection failed")
-            mock_client.get.side_effect = request_error
-
-            adapter = HttpxClientAdapter()
-
-            with adapter:
-                with pytest.raises(HttpClientError) as exc_info:
-                    adapter.get_binary(url="https://example.com/image.png")
-
-            assert "Request error occurred" in str(exc_info.value)
-
-    def test_sync_get_binary_without_context_manager(self) -> None:
-        """Test that synchronous binary GET request fails when client is not initialized."""
-        adapter = HttpxClientAdapter()
-
-        with pytest.raises(HttpClientError) as exc_info:
-            adapter.get_binary(url="https://example.com/image.png")
-
-        assert "Sync client not initialized" in str(exc_info.value)
-
-    def test_sync_get_with_parameters(self) -> None:
-        """Test synchronous GET request with headers, params, and custom timeout."""
-        mock_response_data = {"data": "test"}
-        headers = {"Authorization": "Bearer token"}
-        params = {"limit": 10}
-        timeout = 15.0
-
-        with patch("httpx.Client") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-
-            mock_response = Mock()
-            mock_response.json.return_value = mock_response_data
-            mock_response.raise_for_status.return_value = None
-            mock_client.get.return_value = mock_response
-
-            adapter = HttpxClientAdapter()
-
-            with adapter:
-                result = adapter.get(
-                    url="https://api.example.com/data", headers=headers, params=params, timeout=timeout
-                )
-
-            assert result == mock_response_data
-            mock_client.get.assert_called_once_with(
-                url="https://api.example.com/data", headers=headers, params=params, timeout=timeout
+def _handle_request(request: httpx.Request) -> httpx.Response:
+    """Serve canned responses keyed on the request path, echoing what the client sent for /echo."""
+    match request.url.path:
+        case "/data":
+            return httpx.Response(200, json={"id": 1, "name": "Test name"})
+        case "/image.png":
+            return httpx.Response(200, content=b"fake image data")
+        case "/echo":
+            return httpx.Response(
+                200,
+                json={
+                    "authorization": request.headers.get("Authorization"),
+                    "params": dict(request.url.params),
+                    "timeout": request.extensions["timeout"]["read"],
+                },
             )
+        case "/offline":
+            raise httpx.ConnectError("Connection failed", request=request)
+        case _:
+            return httpx.Response(404, text="Not Found")
 
-    def test_sync_get_http_error(self) -> None:
-        """Test synchronous GET request that returns HTTP error status."""
-        with patch("httpx.Client") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-
-            mock_response = Mock()
-            mock_response.status_code = 404
-            mock_response.text = "Not Found"
 
-            http_error = httpx.HTTPStatusError(message="404 Not Found", request=Mock(), response=mock_response)
-            mock_response.raise_for_status.side_effect = http_error
-            mock_client.get.return_value = mock_response
+_METHODS = ("get", "get_binary", "get_async")
 
-            adapter = HttpxClientAdapter()
 
-            with adapter:
-                with pytest.raises(HttpClientError) as exc_info:
-                    adapter.get(url="https://api.example.com/nonexistent")
+async def _call(adapter: HttpxClientAdapter, method: str, **kwargs: Any) -> Any:
+    """Invoke the named adapter method, entering the async client around get_async calls."""
+    if method == "get_async":
+        async with adapter:
+            return await adapter.get_async(**kwargs)
+    return getattr(adapter, method)(**kwargs)
 
-            assert exc_info.value.status_code == 404
-            assert "404" in str(exc_info.value)
 
-    def test_sync_get_request_error(self) -> None:
-        """Test synchronous GET request that fails due to network error."""
-        with patch("httpx.Client") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
+@pytest.fixture(scope="module")
+def transport() -> httpx.MockTransport:
+    """Fixture providing an in-memory transport that serves canned responses."""
+    return httpx.MockTransport(_handle_request)
 
-            request_error = httpx.RequestError("Connection failed")
-            mock_client.get.side_effect = request_error
 
-            adapter = HttpxClientAdapter()
+@pytest.fixture(scope="module")
+def adapter(transport: httpx.MockTransport) -> Iterator[HttpxClientAdapter]:
+    """Fixture providing one entered adapter whose pooled sync client is shared by the whole module."""
+    with HttpxClientAdapter(transport=transport, async_transport=transport) as entered_adapter:
+        yield entered_adapter
 
-            with adapter:
-                with pytest.raises(HttpClientError) as exc_info:
-                    adapter.get(url="https://api.example.com/test")
 
-            assert "Request error occurred" in str(exc_info.value)
+class TestHttpxClientAdapter:
+    """Test suite for HttpxClientAdapter."""
 
-    def test_sync_get_without_context_manager(self) -> None:
-        """Test that synchronous GET request fails when client is not initialized."""
-        adapter = HttpxClientAdapter()
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "method,path,expected",
+        [
+            ("get", "/data", {"id": 1, "name": "Test name"}),
+            ("get_binary", "/image.png", b"fake image data"),
+            ("get_async", "/data", {"id": 1, "name": "Test name"}),
+        ],
+    )
+    async def test_request_success(self, adapter: HttpxClientAdapter, method: str, path: str, expected: Any) -> None:
+        """Test that a successful GET request returns the decoded response body."""
+        result = await _call(adapter, method, url=f"https://example.com{path}")
+
+        assert result == expected
 
-        with pytest.raises(HttpClientError) as exc_info:
-            adapter.get(url="https://api.example.com/test")
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", _METHODS)
+    @pytest.mark.parametrize(
+        "request_kwargs,expected",
+        [
+            ({}, {"authorization": None, "params": {}, "timeout": 30.0}),
+            (
+                {"headers": {"Authorization": "Bearer token"}, "params": {"limit": 10}, "timeout": 15.0},
+                {"authorization": "Bearer token", "params": {"limit": "10"}, "timeout": 15.0},
+            ),
+        ],
+        ids=["defaults", "custom"],
+    )
+    async def test_request_with_parameters(
+        self, adapter: HttpxClientAdapter, method: str, request_kwargs: dict[str, Any], expected: dict[str, Any]
+    ) -> None:
+        """Test that headers, params, and the custom or default timeout are forwarded with the request."""
+        result = await _call(adapter, method, url="https://api.example.com/echo", **request_kwargs)
+
+        if isinstance(result, bytes):
+            result = json.loads(result)
+        assert result == expected
 
-        assert "Sync client not initialized" in str(exc_info.value)
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", _METHODS)
+    @pytest.mark.parametrize(
+        "path,match,status_code",
+        [("/nonexistent", "404", 404), ("/offline", "Request error occurred", None)],
+        ids=["http_error", "request_error"],
+    )
+    async def test_request_failure(
+        self, adapter: HttpxClientAdapter, method: str, path: str, match: str, status_code: int | None
+    ) -> None:
+        """Test that HTTP error statuses and network errors are raised as HttpClientError."""
+        with pytest.raises(HttpClientError, match=match) as exc_info:
+            await _call(adapter, method, url=f"https://example.com{path}")
+
+        assert exc_info.value.status_code == status_code
 
     @pytest.mark.asyncio
-    async def test_async_get_without_context_manager(self) -> None:
-        """Test that asynchronous GET request fails when client is not initialized."""
+    @pytest.mark.parametrize(
+        "method,match",
+        [
+            ("get", "Sync client not initialized"),
+            ("get_binary", "Sync client not initialized"),
+            ("get_async", "Async client not initialized"),
+        ],
+    )
+    async def test_request_without_context_manager(self, method: str, match: str) -> None:
+        """Test that a GET request fails when its client is not initialized."""
         adapter = HttpxClientAdapter()
 
-        with pytest.raises(HttpClientError) as exc_info:
-            await adapter.get_async(url="https://api.example.com/test")
-
-        assert "Async client not initialized" in str(exc_info.value)
+        assert adapter._sync_client is None
+        assert adapter._async_client is None
+        with pytest.raises(HttpClientError, match=match):
+            result = getattr(adapter, method)(url="https://example.com/data")
+            if method == "get_async":
+                await result
 
     def test_adapter_initialization_without_base_url(self) -> None:
         """Test that the adapter initializes without base_url coupling."""
@@ -1,22 +1,48 @@
-from unittest.mock import Mock
+from types import TracebackType
+from typing import Any, Self
+
+import pytest
 
-from src.domain.ports.outbound.http_client_port import HttpClientPort
 from src.domain.ports.outbound.pokemon_data_port import PokemonDict
 from src.infrastructure.adapters.outbound.pokemon_go_api_adapter import (
     PokemonGoApiAdapter,
 )
 
 
+class StubHttpClient:
+    """Hand-written HTTP client stub that records GET calls and returns or raises a canned result."""
+
+    def __init__(self) -> None:
+        """Initialize the stub with no canned result."""
+        self.response: Any = None
+        self.error: Exception | None = None
+        self.calls: list[dict[str, Any]] = []
+
+    def __enter__(self) -> Self:
+        """Enter the client context."""
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: TracebackType | None
+    ) -> None:
+        """Exit the client context."""
+
+    def get(self, **kwargs: Any) -> Any:
+        """Record the call and return the canned response or raise the canned error."""
+        self.calls.append(kwargs)
+        if self.error:
+            raise self.error
+        return self.response
+
+
 class TestPokemonGoApiAdapter:
     """Test suite for PokemonGoApiAdapter."""
 
     def setup_method(self) -> None:
         """Set up test fixtures."""
-        self.mock_http_client = Mock(spec=HttpClientPort)
-        self.mock_http_client.__enter__ = Mock(return_value=self.mock_http_client)
-        self.mock_http_client.__exit__ = Mock(return_value=None)
+        self.http_client = StubHttpClient()
 
-        self.adapter = PokemonGoApiAdapter(http_client=self.mock_http_client)
+        self.adapter = PokemonGoApiAdapter(http_client=self.http_client)  # type: ignore[arg-type]
 
     def test_fetch_pokemon_data_success(self) -> None:
         """Test successful Pokemon data fetch from API."""
@@ -26,7 +52,7 @@ class TestPokemonGoApiAdapter:
             "stats": {"stamina": 111, "attack": 112, "defense": 96},
         }
 
-        self.mock_http_client.get.return_value = pokedex_data
+        self.http_client.response = pokedex_data
 
         result = self.adapter.fetch_pokemon_data(pokemon_name="Pikachu")
 
@@ -35,49 +61,31 @@ class TestPokemonGoApiAdapter:
         assert result["names"]["English"] == "Pikachu"
         assert result["stats"]["stamina"] == 111
 
-        assert self.mock_http_client.get.call_count == 1
-
-    def test_fetch_pokemon_data_not_found(self) -> None:
-        """Test Pokemon data fetch when Pokemon is not found."""
-        self.mock_http_client.get.side_effect = Exception("HTTP 404: Not Found")
-
-        try:
-            self.adapter.fetch_pokemon_data(pokemon_name="NonExistentPokemon")
-            assert False, "Expected ValueError to be raised"
-        except ValueError as e:
-            assert "Error fetching Pokemon data from API: Status code unknown" in str(e)
-
-    def test_fetch_pokemon_data_invalid_response(self) -> None:
-        """Test Pokemon data fetch with invalid response format."""
-        self.mock_http_client.get.return_value = "invalid response"
-
-        try:
-            self.adapter.fetch_pokemon_data(pokemon_name="TestPokemon")
-            assert False, "Expected ValueError to be raised"
-        except ValueError as e:
-            assert "Expected dictionary response" in str(e)
-
-    def test_fetch_pokemon_data_missing_required_fields(self) -> None:
-        """Test Pokemon data fetch with missing required fields."""
-        pokedex_data = {"id": "TEST_POKEMON"}
-
-        self.mock_http_client.get.return_value = pokedex_data
-
-        try:
-            self.adapter.fetch_pokemon_data(pokemon_name="TestPokemon")
-            assert False, "Expected ValueError to be raised"
-        except ValueError as e:
-            assert "Invalid response format" in str(e)
-
-    def test_fetch_pokemon_data_empty_response(self) -> None:
-        """Test Pokemon data fetch with empty response."""
-        self.mock_http_client.get.return_value = {}
-
-        try:
+        assert len(self.http_client.calls) == 1
+
+    @pytest.mark.parametrize(
+        "response,error,expected_message",
+        [
+            pytest.param(
+                None,
+                Exception("HTTP 404: Not Found"),
+                "Error fetching Pokemon data from API: Status code unknown",
+                id="not_found",
+            ),
+            pytest.param("invalid response", None, "Expected dictionary response", id="invalid_response"),
+            pytest.param({"id": "TEST_POKEMON"}, None, "Invalid response format", id="missing_required_fields"),
+            pytest.param({}, None, "Pokemon 'TESTPOKEMON' not found", id="empty_response"),
+        ],
+    )
+    def test_fetch_pokemon_data_error_paths(
+        self, response: Any, error: Exception | None, expected_message: str
+    ) -> None:
+        """Test that unusable API responses and client failures surface as a ValueError."""
+        self.http_client.response = response
+        self.http_client.error = error
+
+        with pytest.raises(ValueError, match=expected_message):
             self.adapter.fetch_pokemon_data(pokemon_name="TestPokemon")
-            assert False, "Expected ValueError to be raised"
-        except ValueError as e:
-            assert "Pokemon 'TESTPOKEMON' not found" in str(e)
 
     def test_fetch_pokemon_data_uppercase_conversion(self) -> None:
         """Test that Pokemon names are converted to uppercase for API calls."""
@@ -85,14 +93,14 @@ class TestPokemonGoApiAdapter:
             "dexNr": 1,
             "names": {"English": "Bulbasaur"},
         }
-        self.mock_http_client.get.return_value = pokedex_data
+        self.http_client.response = pokedex_data
 
         result = self.adapter.fetch_pokemon_data(pokemon_name="bulbasaur")
 
         assert result == pokedex_data
 
         expected_url = "https://pokemon-go-api.github.io/pokemon-go-api/api/pokedex/name/BULBASAUR.json"
-        self.mock_http_client.get.assert_called_once_with(url=expected_url)
+        assert self.http_client.calls == [{"url": expected_url}]
 
     def test_fetch_pokemon_data_complete_response(self) -> None:
         """Test Pokemon data fetch with complete API response."""
@@ -104,7 +112,7 @@ class TestPokemonGoApiAdapter:
             "generation": 1,
         }
 
-        self.mock_http_client.get.return_value = pokedex_data
+        self.http_client.response = pokedex_data
 
         result = self.adapter.fetch_pokemon_data(pokemon_name="Mewtwo")
 
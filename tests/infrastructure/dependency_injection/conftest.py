@@ -0,0 +1,19 @@
+import pytest
+from injector import Injector
+
+from src.infrastructure.dependency_injection.modules.http_client import HttpClientModule
+from src.infrastructure.dependency_injection.modules.pokemon_data_module import (
+    PokemonDataModule,
+)
+
+
+@pytest.fixture(scope="session")
+def http_injector() -> Injector:
+    """Fixture providing a session-wide Injector configured with the HttpClientModule."""
+    return Injector(modules=[HttpClientModule()])
+
+
+@pytest.fixture(scope="session")
+def pokemon_injector() -> Injector:
+    """Fixture providing a session-wide Injector configured with the HttpClientModule and PokemonDataModule."""
+    return Injector(modules=[HttpClientModule(), PokemonDataModule()])
@@ -1,3 +1,4 @@
+import pytest
 from injector import Injector
 
 from src.application.services.web_image_processing import WebImageProcessingService
@@ -9,33 +10,34 @@ from src.infrastructure.dependency_injection.modules.image_service import (
 from src.infrastructure.services.pil_image_processor import PILImageProcessor
 
 
-def test_provide_image_processor_returns_pil_processor() -> None:
+@pytest.fixture(scope="module")
+def image_injector() -> Injector:
+    """Fixture providing a module-wide Injector configured with the ImageServiceModule."""
+    # Include HttpClientModule to satisfy WebImageProcessingService dependencies
+    return Injector(modules=[HttpClientModule(), ImageServiceModule()])
+
+
+def test_provide_image_processor_returns_pil_processor(image_injector: Injector) -> None:
     """Test that the ImageServiceModule provides an instance of PILImageProcessor."""
-    injector = Injector(modules=[ImageServiceModule()])
-    processor = injector.get(ImageProcessor)  # type: ignore[type-abstract]
+    processor = image_injector.get(ImageProcessor)  # type: ignore[type-abstract]
     assert isinstance(processor, PILImageProcessor)
 
 
-def test_provide_web_image_processing_service_returns_service() -> None:
+def test_provide_web_image_processing_service_returns_service(image_injector: Injector) -> None:
     """Test that the ImageServiceModule provides an instance of WebImageProcessingService."""
-    # Include HttpClientModule to satisfy WebImageProcessingService dependencies
-    injector = Injector(modules=[HttpClientModule(), ImageServiceModule()])
-    service = injector.get(WebImageProcessingService)
+    service = image_injector.get(WebImageProcessingService)
     assert isinstance(service, WebImageProcessingService)
 
 
-def test_image_processor_is_singleton() -> None:
+def test_image_processor_is_singleton(image_injector: Injector) -> None:
     """Test that the ImageProcessor provides the same instance when requested multiple times."""
-    injector = Injector(modules=[ImageServiceModule()])
-    processor1 = injector.get(ImageProcessor)  # type: ignore[type-abstract]
-    processor2 = injector.get(ImageProcessor)  # type: ignore[type-abstract]
+    processor1 = image_injector.get(ImageProcessor)  # type: ignore[type-abstract]
+    processor2 = image_injector.get(ImageProcessor)  # type: ignore[type-abstract]
     assert processor1 is processor2
 
 
-def test_web_image_processing_service_is_singleton() -> None:
+def test_web_image_processing_service_is_singleton(image_injector: Injector) -> None:
     """Test that the WebImageProcessingService provides the same instance when requested multiple times."""
-    # Include HttpClientModule to satisfy WebImageProcessingService dependencies
-    injector = Injector(modules=[HttpClientModule(), ImageServiceModule()])
-    service1 = injector.get(WebImageProcessingService)
-    service2 = injector.get(WebImageProcessingService)
+    service1 = image_injector.get(WebImageProcessingService)
+    service2 = image_injector.get(WebImageProcessingService)
     assert service1 is service2
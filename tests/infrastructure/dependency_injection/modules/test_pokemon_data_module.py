@@ -4,14 +4,9 @@ from src.domain.ports.outbound.pokemon_data_port import PokemonDataPort, Pokemon
 from src.infrastructure.adapters.outbound.pokemon_go_api_adapter import (
     PokemonGoApiAdapter,
 )
-from src.infrastructure.dependency_injection.modules.http_client import HttpClientModule
-from src.infrastructure.dependency_injection.modules.pokemon_data_module import (
-    PokemonDataModule,
-)
 
 
-def test_provide_pokemon_data_port_returns_adapter() -> None:
+def test_provide_pokemon_data_port_returns_adapter(pokemon_injector: Injector) -> None:
     """Test that the provide_pokemon_data_port method returns an instance of PokemonGoApiAdapter."""
-    injector = Injector(modules=[HttpClientModule(), PokemonDataModule()])
-    port = injector.get(PokemonDataPort[PokemonDict])  # type: ignore[type-abstract]
+    port = pokemon_injector.get(PokemonDataPort[PokemonDict])  # type: ignore[type-abstract]
     assert isinstance(port, PokemonGoApiAdapter)
@@ -1,11 +1,18 @@
-from typing import cast
-
+import pytest
 from injector import inject
 
 from src.domain.ports.outbound.http_client_port import HttpClientPort
 from src.infrastructure.adapters.outbound.httpx_client_adapter import HttpxClientAdapter
 from src.infrastructure.dependency_injection.setup import create_injector, injector
 
+_CUSTOM_CLIENT = HttpxClientAdapter(timeout=15.0)
+
+
+@pytest.fixture(scope="module")
+def global_http_client() -> HttpClientPort:
+    """Fixture providing the HttpClientPort resolved once from the global injector."""
+    return injector.get(HttpClientPort)  # type: ignore[type-abstract]
+
 
 class TestInjectorSetup:
     """Test suite for injector setup."""
@@ -18,49 +25,35 @@ class TestInjectorSetup:
 
         assert isinstance(http_client, HttpxClientAdapter)
 
-    def test_global_injector_is_configured(self) -> None:
+    def test_global_injector_is_configured(self, global_http_client: HttpClientPort) -> None:
         """Test that the global injector instance is properly configured."""
-        http_client = injector.get(HttpClientPort)  # type: ignore[type-abstract]
-
-        assert isinstance(http_client, HttpxClientAdapter)
-
-    def test_inject_decorator_works_with_global_injector(self) -> None:
-        """Test that @inject decorator works with the global injector."""
-
-        @inject
-        def test_function(*, http_client: HttpClientPort) -> str:
-            return f"Got client: {type(http_client).__name__}"
-
-        result = injector.call_with_injection(test_function)
-
-        assert result == "Got client: HttpxClientAdapter"
+        assert isinstance(global_http_client, HttpxClientAdapter)
 
-    def test_inject_with_explicit_parameter(self) -> None:
-        """Test that explicit parameters override injection."""
-        custom_client = HttpxClientAdapter(timeout=15.0)
+    @pytest.mark.parametrize("kwargs", [{}, {"http_client": _CUSTOM_CLIENT}], ids=["injected", "explicit"])
+    def test_call_with_injection(self, global_http_client: HttpClientPort, kwargs: dict[str, HttpClientPort]) -> None:
+        """Test that @inject resolves the client from the global injector unless one is passed explicitly."""
 
         @inject
-        def test_function(*, http_client: HttpClientPort) -> str:
-            # Cast to concrete type to access private attributes.
-            concrete_client = cast(HttpxClientAdapter, http_client)
-            return f"Timeout: {concrete_client._timeout}"
+        def test_function(*, http_client: HttpClientPort) -> HttpClientPort:
+            return http_client
 
-        result = injector.call_with_injection(test_function, kwargs={"http_client": custom_client})
+        result = injector.call_with_injection(test_function, kwargs=kwargs)
 
-        assert result == "Timeout: 15.0"
+        assert result is kwargs.get("http_client", global_http_client)
 
-    def test_dependency_injection_in_class_constructor(self) -> None:
+    def test_dependency_injection_in_class_constructor(self, global_http_client: HttpClientPort) -> None:
         """Test dependency injection in class constructors."""
 
         class TestService:
             @inject
             def __init__(self, *, http_client: HttpClientPort) -> None:
                 self.http_client = http_client
+                self._client_type_name = type(http_client).__name__
 
             def get_client_type(self) -> str:
-                return type(self.http_client).__name__
+                return self._client_type_name
 
         service = injector.create_object(TestService)
 
         assert service.get_client_type() == "HttpxClientAdapter"
-        assert isinstance(service.http_client, HttpxClientAdapter)
+        assert service.http_client is global_http_client
@@ -1,191 +1,169 @@
-import unittest
-from unittest.mock import Mock, patch
+from contextlib import nullcontext
+from types import SimpleNamespace
+from typing import Iterator
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 
 from src.infrastructure.services.pil_image_processor import PILImageProcessor
 
+_IMAGE_DATA = b"fake_image_data"
 
-class TestPILImageProcessor(unittest.TestCase):
-    """Test cases for PILImageProcessor."""
-
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.service = PILImageProcessor()
-        self.mock_on_success = Mock()
-        self.mock_on_error = Mock()
-        self.mock_on_started = Mock()
-        self.mock_on_finished = Mock()
-        self.mock_cancellation_check = Mock(return_value=False)
-        self.test_image_data = b"fake_image_data"
-
-    def test_initialization(self) -> None:
-        """Test that the service initializes correctly."""
-        service = PILImageProcessor()
-
-        self.assertIsInstance(service, PILImageProcessor)
-
-    @patch("threading.Thread")
-    def test_fetch_image_async_starts_thread(self, mock_thread: Mock) -> None:
-        """Test that fetch_image_async starts a daemon thread."""
-        mock_thread_instance = Mock()
-        mock_thread.return_value = mock_thread_instance
-
-        result = self.service.fetch_image_async(
-            image_data=self.test_image_data,
-            on_success=self.mock_on_success,
-            on_error=self.mock_on_error,
-            on_started=self.mock_on_started,
-            on_finished=self.mock_on_finished,
-            cancellation_check=self.mock_cancellation_check,
-        )
-
-        mock_thread.assert_called_once()
-        mock_thread_instance.start.assert_called_once()
-        self.assertIs(result, mock_thread_instance)
-
-        _, kwargs = mock_thread.call_args
-        self.assertTrue(kwargs["daemon"])
 
-    @patch("src.infrastructure.services.pil_image_processor.Image")
-    @patch("src.infrastructure.services.pil_image_processor.ImageTk.PhotoImage")
-    def test_download_and_process_image_success(self, mock_photo_image: Mock, mock_image: Mock) -> None:
-        """Test successful image processing."""
-        mock_pil_image = Mock()
-        mock_pil_image.mode = "RGB"
-        mock_converted_image = Mock()
-        mock_final_image = Mock()
+@pytest.fixture(scope="module")
+def service() -> PILImageProcessor:
+    """Fixture providing a module-wide PILImageProcessor, which holds no per-call state."""
+    return PILImageProcessor()
 
-        mock_image.open.return_value = mock_pil_image
-        mock_image.Mode.RGBA = "RGBA"
-        mock_pil_image.convert.return_value = mock_converted_image
-        mock_photo_image.return_value = mock_final_image
 
-        result = self.service._download_and_process_image(image_data=self.test_image_data)
+@pytest.fixture
+def callbacks() -> SimpleNamespace:
+    """Fixture providing fresh callback mocks for the async and thread entry points."""
+    return SimpleNamespace(
+        on_success=Mock(),
+        on_error=Mock(),
+        on_started=Mock(),
+        on_finished=Mock(),
+        cancellation_check=lambda: False,
+    )
 
-        mock_image.open.assert_called_once()
-        mock_pil_image.convert.assert_called_once_with("RGBA")
-        mock_photo_image.assert_called_once_with(mock_converted_image)
 
-        self.assertIs(result, mock_final_image)
+@pytest.fixture
+def pil_mocks() -> Iterator[tuple[Mock, Mock]]:
+    """Fixture patching PIL's Image.open and ImageTk.PhotoImage, yielded as a pair."""
+    with patch("PIL.Image.open") as mock_open, patch("PIL.ImageTk.PhotoImage") as mock_photo_image:
+        yield mock_open, mock_photo_image
 
-    @patch("src.infrastructure.services.pil_image_processor.Image")
-    def test_download_and_process_image_with_rgba_mode(self, mock_image: Mock) -> None:
-        """Test image processing when image is already in RGBA mode."""
-        mock_pil_image = Mock()
-        mock_pil_image.mode = "RGBA"
 
-        mock_image.open.return_value = mock_pil_image
-        mock_image.Mode.RGBA = "RGBA"
-
-        with patch("src.infrastructure.services.pil_image_processor.ImageTk.PhotoImage") as mock_photo_image:
-            mock_final_image = Mock()
-            mock_photo_image.return_value = mock_final_image
+class TestPILImageProcessor:
+    """Test cases for PILImageProcessor."""
 
-            result = self.service._download_and_process_image(image_data=self.test_image_data)
+    def test_initialization(self, service: PILImageProcessor) -> None:
+        """Test that the service initializes correctly."""
+        assert isinstance(service, PILImageProcessor)
 
-            mock_image.open.assert_called_once()
-            mock_pil_image.convert.assert_not_called()
-            mock_photo_image.assert_called_once_with(mock_pil_image)
+    def test_fetch_image_async_starts_thread(self, callbacks: SimpleNamespace) -> None:
+        """Test that fetch_image_async starts a daemon thread from the injected thread factory."""
+        mock_thread_instance = Mock()
+        mock_thread = Mock(return_value=mock_thread_instance)
+        service = PILImageProcessor(thread_factory=mock_thread)
 
-            self.assertIs(result, mock_final_image)
+        result = service.fetch_image_async(image_data=_IMAGE_DATA, **vars(callbacks))
 
-    def test_download_and_process_image_error(self) -> None:
-        """Test handling of error during image processing."""
-        with (
-            patch(
-                "src.infrastructure.services.pil_image_processor.Image.open", side_effect=Exception("Invalid image")
-            ),
-            self.assertRaisesRegex(ValueError, "Failed to load image"),
-        ):
-            self.service._download_and_process_image(image_data=self.test_image_data)
+        mock_thread.assert_called_once()
+        mock_thread_instance.start.assert_called_once()
+        assert result is mock_thread_instance
 
-    def test_fetch_image_thread_success(self) -> None:
+        _, kwargs = mock_thread.call_args
+        assert kwargs["daemon"]
+
+    @pytest.mark.parametrize(
+        "mode,expect_convert,side_effect",
+        [("RGB", True, None), ("RGBA", False, None), ("RGB", False, Exception("Invalid image"))],
+        ids=["converts_to_rgba", "already_rgba", "open_error"],
+    )
+    def test_download_and_process_image(
+        self,
+        service: PILImageProcessor,
+        pil_mocks: tuple[Mock, Mock],
+        mode: str,
+        expect_convert: bool,
+        side_effect: Exception | None,
+    ) -> None:
+        """Test that image data is opened, converted to RGBA only when needed, and wrapped for Tk."""
+        mock_open, mock_photo_image = pil_mocks
+        mock_pil_image = MagicMock(spec_set=["mode", "convert"], mode=mode)
+        mock_open.return_value = mock_pil_image
+        mock_open.side_effect = side_effect
+
+        with pytest.raises(ValueError, match="Failed to load image") if side_effect else nullcontext():
+            result = service._download_and_process_image(image_data=_IMAGE_DATA)
+
+        mock_open.assert_called_once()
+        assert mock_pil_image.convert.call_count == expect_convert
+        if side_effect is None:
+            expected_image = mock_pil_image.convert.return_value if expect_convert else mock_pil_image
+            mock_photo_image.assert_called_once_with(expected_image)
+            assert result is mock_photo_image.return_value
+        else:
+            mock_photo_image.assert_not_called()
+
+    def test_fetch_image_thread_success(self, service: PILImageProcessor, callbacks: SimpleNamespace) -> None:
         """Test successful image processing in the fetching thread."""
-        with patch.object(self.service, "_download_and_process_image") as mock_download:
+        with patch.object(service, "_download_and_process_image") as mock_download:
             mock_processed_image = Mock()
             mock_download.return_value = mock_processed_image
 
-            self.service._fetch_image_thread(
-                image_data=self.test_image_data,
-                on_success=self.mock_on_success,
-                on_error=self.mock_on_error,
-                on_started=self.mock_on_started,
-                on_finished=self.mock_on_finished,
-                cancellation_check=self.mock_cancellation_check,
-            )
-
-            self.mock_on_started.assert_called_once()
-            mock_download.assert_called_once_with(image_data=self.test_image_data)
-            self.mock_on_success.assert_called_once_with(mock_processed_image)
-            self.mock_on_finished.assert_called_once()
-
-    def test_fetch_image_thread_exception_handling(self) -> None:
+            service._fetch_image_thread(image_data=_IMAGE_DATA, **vars(callbacks))
+
+            assert [
+                callbacks.on_started.call_count,
+                mock_download.call_count,
+                callbacks.on_success.call_count,
+                callbacks.on_error.call_count,
+                callbacks.on_finished.call_count,
+            ] == [1, 1, 1, 0, 1]
+            assert mock_download.call_args == call(image_data=_IMAGE_DATA)
+            callbacks.on_success.assert_called_once_with(mock_processed_image)
+
+    def test_fetch_image_thread_exception_handling(
+        self, service: PILImageProcessor, callbacks: SimpleNamespace
+    ) -> None:
         """Test exception handling in the image fetching thread."""
-        with patch.object(self.service, "_download_and_process_image", side_effect=Exception("Processing error")):
-            self.service._fetch_image_thread(
-                image_data=self.test_image_data,
-                on_success=self.mock_on_success,
-                on_error=self.mock_on_error,
-                on_started=self.mock_on_started,
-                on_finished=self.mock_on_finished,
-                cancellation_check=self.mock_cancellation_check,
-            )
-
-            self.mock_on_started.assert_called_once()
-            self.mock_on_error.assert_called_once()
-            error_call_args = self.mock_on_error.call_args[0][0]
-            self.assertIn("Error loading image", error_call_args)
-            self.assertIn("Processing error", error_call_args)
-            self.mock_on_success.assert_not_called()
-            self.mock_on_finished.assert_called_once()
-
-    def test_fetch_image_thread_early_cancellation(self) -> None:
+        with patch.object(service, "_download_and_process_image", side_effect=Exception("Processing error")):
+            service._fetch_image_thread(image_data=_IMAGE_DATA, **vars(callbacks))
+
+            assert [
+                callbacks.on_started.call_count,
+                callbacks.on_success.call_count,
+                callbacks.on_error.call_count,
+                callbacks.on_finished.call_count,
+            ] == [1, 0, 1, 1]
+            error_call_args = callbacks.on_error.call_args[0][0]
+            assert "Error loading image" in error_call_args
+            assert "Processing error" in error_call_args
+
+    def test_fetch_image_thread_early_cancellation(
+        self, service: PILImageProcessor, callbacks: SimpleNamespace
+    ) -> None:
         """Test early cancellation before image processing."""
-        self.mock_cancellation_check.return_value = True
-
-        with patch.object(self.service, "_download_and_process_image") as mock_download:
-            self.service._fetch_image_thread(
-                image_data=self.test_image_data,
-                on_success=self.mock_on_success,
-                on_error=self.mock_on_error,
-                on_started=self.mock_on_started,
-                on_finished=self.mock_on_finished,
-                cancellation_check=self.mock_cancellation_check,
-            )
+        callbacks.cancellation_check = lambda: True
 
-            # Should start but not proceed due to immediate cancellation
-            self.mock_on_started.assert_called_once()
-            mock_download.assert_not_called()
-            self.mock_on_success.assert_not_called()
-            self.mock_on_error.assert_not_called()
-            self.mock_on_finished.assert_not_called()
+        with patch.object(service, "_download_and_process_image") as mock_download:
+            service._fetch_image_thread(image_data=_IMAGE_DATA, **vars(callbacks))
 
-    def test_fetch_image_sync_success(self) -> None:
+            # Should start but not proceed due to immediate cancellation
+            assert [
+                callbacks.on_started.call_count,
+                mock_download.call_count,
+                callbacks.on_success.call_count,
+                callbacks.on_error.call_count,
+                callbacks.on_finished.call_count,
+            ] == [1, 0, 0, 0, 0]
+
+    def test_fetch_image_sync_success(self, service: PILImageProcessor) -> None:
         """Test successful synchronous image processing."""
-        with patch.object(self.service, "_download_and_process_image") as mock_download:
+        with patch.object(service, "_download_and_process_image") as mock_download:
             mock_processed_image = Mock()
             mock_download.return_value = mock_processed_image
 
-            result = self.service.fetch_image_sync(image_data=self.test_image_data)
+            result = service.fetch_image_sync(image_data=_IMAGE_DATA)
 
-            mock_download.assert_called_once_with(image_data=self.test_image_data)
-            self.assertIs(result, mock_processed_image)
+            mock_download.assert_called_once_with(image_data=_IMAGE_DATA)
+            assert result is mock_processed_image
 
-    def test_fetch_image_sync_error_propagation(self) -> None:
+    def test_fetch_image_sync_error_propagation(self, service: PILImageProcessor) -> None:
         """Test that synchronous method propagates errors correctly."""
         with (
-            patch.object(self.service, "_download_and_process_image", side_effect=ValueError("Processing error")),
-            self.assertRaisesRegex(ValueError, "Processing error"),
+            patch.object(service, "_download_and_process_image", side_effect=ValueError("Processing error")),
+            pytest.raises(ValueError, match="Processing error"),
         ):
-            self.service.fetch_image_sync(image_data=self.test_image_data)
+            service.fetch_image_sync(image_data=_IMAGE_DATA)
 
 
 @pytest.mark.parametrize("image_data", [b"fake_image_data", b"another_image_data", b"third_image_data"])
-def test_fetch_image_sync_with_different_data_parametrized(image_data: bytes) -> None:
+def test_fetch_image_sync_with_different_data_parametrized(service: PILImageProcessor, image_data: bytes) -> None:
     """Test synchronous method with different image data using pytest parametrization."""
-    service = PILImageProcessor()
-
     with patch.object(service, "_download_and_process_image") as mock_download:
         mock_processed_image = Mock()
         mock_download.return_value = mock_processed_image